@@ -5,13 +5,13 @@ import random
 
 sim = se.Simulation(headless=False, width=1280, height=720, title="Boid Slalom Squad")
 
-while not sim.are_all_shaders_ready():
-    sim.update_shader_loading()
+if not sim.wait_shaders_ready():
+    raise RuntimeError(f"Shaders failed to load: {sim.get_shader_load_status()}")
 
-while sim.object_count() > 0:
-    sim.remove_object(0)
+sim.clear()
 
 TARGET_ID, OBSTACLE_COUNT, BOID_COUNT = 0, 4, 7
+MAX_LET_BINDINGS = 16  # per-equation `let` slot budget of the engine
 OBSTACLE_START_ID = 1
 BOID_START_ID = OBSTACLE_START_ID + OBSTACLE_COUNT
 
@@ -53,41 +53,50 @@ for i in range(BOID_COUNT):
     )
     boids.append(bid)
 
+# Terms shared by every boid: built once, reused in each equation
+FX_SEEK = f"12.0 * (p[{TARGET_ID}].x - x)"
+FY_SEEK = f"12.0 * (p[{TARGET_ID}].y - y)"
+
+# Each obstacle's weight / distance^2 is bound once with `let` and reused by ax and ay
+obs_lets, fx_obs, fy_obs = [], [], []
+for obs in obstacles:
+    d2 = f"((x - p[{obs}].x)*(x - p[{obs}].x) + (y - p[{obs}].y)*(y - p[{obs}].y) + 0.1)"
+    obs_lets.append(f"let wo{obs} = 45.0 / {d2};")
+    fx_obs.append(f"(x - p[{obs}].x) * wo{obs}")
+    fy_obs.append(f"(y - p[{obs}].y) * wo{obs}")
+
+OBS_LETS = " ".join(obs_lets)
+OBS_FX, OBS_FY = " + ".join(fx_obs), " + ".join(fy_obs)
+FX_DRAG, FY_DRAG = "-2.0 * vx", "-2.0 * vy"
+TORQUE = "30.0 * sin(atan2(vy, vx) - theta) - 8.0 * omega"
+
 for i in range(BOID_COUNT):
     me = boids[i]
-    
-    fx_seek = f"12.0 * (p[{TARGET_ID}].x - x)"
-    fy_seek = f"12.0 * (p[{TARGET_ID}].y - y)"
-    
-    fx_obs, fy_obs = [], []
-    for obs in obstacles:
-        d2 = f"((x - p[{obs}].x)*(x - p[{obs}].x) + (y - p[{obs}].y)*(y - p[{obs}].y) + 0.1)"
-        fx_obs.append(f"45.0 * (x - p[{obs}].x) / {d2}") 
-        fy_obs.append(f"45.0 * (y - p[{obs}].y) / {d2}")
-    
-    fx_avoid_obs, fy_avoid_obs = " + ".join(fx_obs), " + ".join(fy_obs)
-
-    fx_sep, fy_sep = [], []
+
+    # Peers share whatever slots the obstacles leave; the rest inline their weight
+    sep_lets, fx_sep, fy_sep = [], [], []
     for other in boids:
         if other == me: continue
         d2 = f"((x - p[{other}].x)*(x - p[{other}].x) + (y - p[{other}].y)*(y - p[{other}].y) + 0.05)"
-        fx_sep.append(f"3.0 * (x - p[{other}].x) / {d2}")
-        fy_sep.append(f"3.0 * (y - p[{other}].y) / {d2}")
-
+        if len(obs_lets) + len(sep_lets) < MAX_LET_BINDINGS:
+            sep_lets.append(f"let ws{other} = 3.0 / {d2};")
+            ws = f"ws{other}"
+        else:
+            ws = f"(3.0 / {d2})"
+        fx_sep.append(f"(x - p[{other}].x) * {ws}")
+        fy_sep.append(f"(y - p[{other}].y) * {ws}")
+
+    sep_bindings = " ".join(sep_lets)
     fx_separation, fy_separation = " + ".join(fx_sep), " + ".join(fy_sep)
 
-    fx_drag, fy_drag = "-2.0 * vx", "-2.0 * vy"
-
-    acc_x = f"{fx_seek} + {fx_avoid_obs} + {fx_separation} + {fx_drag}"
-    acc_y = f"{fy_seek} + {fy_avoid_obs} + {fy_separation} + {fy_drag}"
-
-    torque = "30.0 * sin(atan2(vy, vx) - theta) - 8.0 * omega"
+    acc_x = f"{FX_SEEK} + {OBS_FX} + {fx_separation} + {FX_DRAG}"
+    acc_y = f"{FY_SEEK} + {OBS_FY} + {fy_separation} + {FY_DRAG}"
 
     color_r, color_g, color_b = ("0.2", "0.9", "1.0") if i % 3 == 0 else (
         ("0.8", "0.4", "1.0") if i % 3 == 1 else ("0.4", "1.0", "0.6")
     )
 
-    sim.set_equation(me, f"{acc_x}, {acc_y}, {torque}, {color_r}, {color_g}, {color_b}, 1.0")
+    sim.set_equation(me, f"{OBS_LETS} {sep_bindings} {acc_x}, {acc_y}, {TORQUE}, {color_r}, {color_g}, {color_b}, 1.0")
 
 sim.set_parameter("damping", 0.0)
 
@@ -1,49 +1,86 @@
 #!/usr/bin/env python3
+import sys
 import hyperstellar as se
 import numpy as np
-import time
+
+NATIVE = "--native" in sys.argv  # run accept/reject inside the engine via mcmc_run
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to vectorized NumPy
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def mh_step(w_x, w_y, w_prob, state_x, state_y, state_b, moved, coins, accept):
+        # Metropolis-Hastings accept/reject, updating walker state in place
+        for i in range(w_x.size):
+            if not moved[i]:
+                accept[i] = False
+                continue
+            pp = max(0.001, state_b[i])
+            if coins[i] < min(1.0, pp / w_prob[i]):
+                w_x[i] = state_x[i]
+                w_y[i] = state_y[i]
+                w_prob[i] = pp
+                accept[i] = True
+            else:
+                accept[i] = False
+else:
+    def mh_step(w_x, w_y, w_prob, state_x, state_y, state_b, moved, coins, accept):
+        # Metropolis-Hastings accept/reject, updating walker state in place
+        pp = np.maximum(0.001, state_b)
+        np.logical_and(moved, coins < np.minimum(1.0, pp / w_prob), out=accept)
+        w_x[accept] = state_x[accept]
+        w_y[accept] = state_y[accept]
+        w_prob[accept] = pp[accept]
 
 sim = se.Simulation(headless=False, width=800, height=600, enable_grid=False)
 
-while not sim.are_all_shaders_ready():
-    sim.update_shader_loading()
-    time.sleep(0.01)
+if not sim.wait_shaders_ready():
+    raise RuntimeError(f"Shaders failed to load: {sim.get_shader_load_status()}")
 
-while sim.object_count() > 0:
-    sim.remove_object(0)
+sim.clear()
 
 # ONE equation shared by all walkers
 # GPU computes time-evolving quantum wave function at particle's position
 shared_equation = "0,0,0,0.3,0.6,exp(-1*(x*x+y*y)*(1 + 0.5*sin(0.3*t))),1"
 
+# One persistent PCG64 generator for setup and sampling (seeded for reproducibility)
+rng = np.random.default_rng(0)
+
 # Create multiple independent MCMC walkers
 num_walkers = 300  # MORE walkers
-walkers = []
-walker_ids = []
-
-for i in range(num_walkers):
-    # Random initial position (continuous)
-    angle = 2 * np.pi * np.random.random()
-    r = np.random.exponential(1.0)
-    x0 = r * np.cos(angle)
-    y0 = r * np.sin(angle)
-    
-    pid = sim.add_object(
-        x=x0, y=y0, vx=0, vy=0,
-        mass=1, charge=0,
-        skin=se.SkinType.CIRCLE,
-        size=0.15,
-        r=0.2, g=0.5, b=0.9, a=0.8
-    )
-    sim.set_equation(pid, shared_equation)
-    
-    walkers.append({
-        'pid': pid,
-        'x': x0,
-        'y': y0,
-        'prob': 1.0
-    })
-    walker_ids.append(pid)
+
+# Random initial positions (continuous), drawn for all walkers at once.
+# Walker state lives in flat arrays (structure of arrays) for vectorized accept/reject
+angles = rng.uniform(0, 2 * np.pi, num_walkers)
+radii = rng.exponential(1.0, num_walkers)
+w_x = radii * np.cos(angles)
+w_y = radii * np.sin(angles)
+
+# BATCH ADD: create every walker in one call
+walker_ids = sim.add_objects_batch(
+    w_x, w_y, vx=0, vy=0,
+    mass=1, charge=0,
+    skin=se.SkinType.CIRCLE,
+    size=0.15,
+    r=0.2, g=0.5, b=0.9, a=0.8
+)
+
+def make_kinematics_update(index=0):
+    update = se.BatchKinematicsUpdate()
+    update.index = index
+    update.vx = 0
+    update.vy = 0
+    update.b = 0.9
+    return update
+
+# One proposal template per walker (aligned with walker_ids); only x/y change per frame
+propose_tmpl = [make_kinematics_update(pid) for pid in walker_ids]
+
+# Parse the shared equation once and bind it to every walker
+sim.set_equation_shared(walker_ids, shared_equation)
 
 print(f"Created {num_walkers} independent MCMC walkers using 1 equation")
 
@@ -52,98 +89,82 @@ sim.update(0.01)
 
 # BATCH GET: Get all initial probabilities at once
 batch_states = sim.batch_get(walker_ids)
-for i, state in enumerate(batch_states):
-    walkers[i]['prob'] = max(0.001, state.b)
+w_prob = np.maximum(0.001, np.fromiter((s.b for s in batch_states), dtype=np.float64, count=num_walkers))
 
 # MCMC parameters
 step_size = 0.5
 steps_per_frame = 1  # Only 1 step per walker per frame
+min_jump2 = 1e-4  # Squared jump length below which a walker is left in place
+accept = np.zeros(num_walkers, dtype=np.bool_)
+# Preallocated reject updates, packed front-to-back each frame (index, x, y, b rewritten)
+reject_buf = [make_kinematics_update() for _ in range(num_walkers)]
+
+# Compile mh_step before the first frame so the JIT doesn't stall rendering
+_one = np.ones(1)
+mh_step(_one.copy(), _one.copy(), _one.copy(), _one, _one, _one,
+        np.ones(1, dtype=np.bool_), np.zeros(1), np.zeros(1, dtype=np.bool_))
 
 frame = 0
 while not sim.should_close():
     sim.process_input()
     
-    # Single GPU update for all walkers
-    sim.update(0.001)
+    if NATIVE:
+        # Whole propose/step/accept loop runs natively; seed varies per frame
+        accepted = sim.mcmc_run(walker_ids, steps_per_frame, step_size, seed=frame,
+                                min_jump2=min_jump2)
+        frame += 1
+        if frame % 60 == 0:
+            print(f"Frame {frame}: {accepted} accepted ({(accepted/(num_walkers*steps_per_frame))*100:.1f}%)")
+        sim.render()
+        continue
+    
+    # Draw all proposal steps and Metropolis coin flips for this frame at once
+    noise = rng.standard_normal((num_walkers, 2))
+    noise *= step_size
+    coins = rng.random(num_walkers)
     
-    # Prepare BATCH UPDATE for all proposed positions
-    updates = []
-    for w in walkers:
-        # Propose new position
-        prop_x = w['x'] + np.random.normal(0, step_size)
-        prop_y = w['y'] + np.random.normal(0, step_size)
-        
-        # Create update data
-        update = se.BatchUpdateData()
-        update.index = w['pid']
-        update.x = prop_x
-        update.y = prop_y
-        update.vx = 0
-        update.vy = 0
-        update.mass = 1
-        update.charge = 0
-        update.rotation = 0
-        update.angular_velocity = 0
-        update.width = 0.15
-        update.height = 0.15
-        update.r = 0.2
-        update.g = 0.5
-        update.b = 0.9
-        update.a = 0.8
-        
-        updates.append(update)
+    # Walkers whose jump is negligible stay inactive this frame (no teleport)
+    moved = noise[:, 0] * noise[:, 0] + noise[:, 1] * noise[:, 1] > min_jump2
     
-    # BATCH UPDATE: Teleport ALL walkers to proposed positions at once
-    sim.batch_update(updates)
+    # Prepare BATCH UPDATE in the per-walker templates (aligned with walker_ids);
+    # a non-moving walker is simply rewritten at its current position
+    noise[~moved] = 0.0
+    prop_x = w_x + noise[:, 0]
+    prop_y = w_y + noise[:, 1]
+    for update, px, py in zip(propose_tmpl, prop_x.tolist(), prop_y.tolist()):
+        update.x = px
+        update.y = py
     
-    # ONE GPU update for all particles at new positions
-    sim.update(0.001)
+    # FUSED STEP: teleport walkers, advance the GPU and read back x, y, b
+    xs, ys, bs = sim.mcmc_step(propose_tmpl, walker_ids, 0.002)
     
-    # BATCH GET: Read ALL probabilities at new positions at once
-    batch_states = sim.batch_get(walker_ids)
+    state_x = np.asarray(xs, dtype=np.float64)
+    state_y = np.asarray(ys, dtype=np.float64)
+    state_b = np.asarray(bs, dtype=np.float64)
     
-    # Prepare reject updates (for walkers that need to go back)
-    reject_updates = []
+    # Metropolis-Hastings accept/reject for all moving walkers at once
+    mh_step(w_x, w_y, w_prob, state_x, state_y, state_b, moved, coins, accept)
+    reject = moved & ~accept
     
-    # Process accept/reject for all walkers
-    for i, (w, state) in enumerate(zip(walkers, batch_states)):
-        prop_prob = max(0.001, state.b)
-        
-        # Metropolis-Hastings
-        if np.random.random() < min(1.0, prop_prob / w['prob']):
-            # ACCEPT: update state (already at new position)
-            w['x'] = state.x
-            w['y'] = state.y
-            w['prob'] = prop_prob
-        else:
-            # REJECT: prepare to teleport back
-            update = se.BatchUpdateData()
-            update.index = w['pid']
-            update.x = w['x']  # Original position
-            update.y = w['y']
-            update.vx = 0
-            update.vy = 0
-            update.mass = 1
-            update.charge = 0
-            update.rotation = 0
-            update.angular_velocity = 0
-            update.width = 0.15
-            update.height = 0.15
-            update.r = 0.2
-            update.g = 0.5
-            update.b = w['prob']  # Use probability for blue channel
-            update.a = 0.8
-            
-            reject_updates.append(update)
+    # REJECT: teleport back to the (unchanged) current position,
+    # packing rejected walkers into the front of the preallocated buffer
+    reject_idx = np.nonzero(reject)[0]
+    for k, i in enumerate(reject_idx):
+        update = reject_buf[k]
+        update.index = walker_ids[i]
+        update.x = w_x[i]
+        update.y = w_y[i]
+        update.b = w_prob[i]  # Use probability for blue channel
     
     # BATCH UPDATE: Teleport rejected walkers back at once
-    if reject_updates:
-        sim.batch_update(reject_updates)
+    if reject_idx.size:
+        sim.batch_update_kinematics(reject_buf[:reject_idx.size])
     
     frame += 1
     if frame % 60 == 0:
-        accepted = num_walkers - len(reject_updates)
-        print(f"Frame {frame}: {accepted}/{num_walkers} accepted ({(accepted/num_walkers)*100:.1f}%)")
+        proposed = np.count_nonzero(moved)
+        accepted = proposed - reject_idx.size
+        print(f"Frame {frame}: {accepted}/{proposed} accepted ({(accepted/max(1, proposed))*100:.1f}%)")
     
     sim.render()
 
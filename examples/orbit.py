@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 import hyperstellar as se
 import math
+import sys
+import time
 
-sim = se.Simulation(headless=False, width=1920, height=1080, 
+# --bench: headless fixed-length run without rendering, for timing/regressions
+BENCH = "--bench" in sys.argv
+BENCH_FRAMES = 3600
+
+sim = se.Simulation(headless=BENCH, width=1920, height=1080, 
                     title="Two-Body Orbit", enable_grid=False)
 #it creates one object by defualt, so we remove it
-while sim.object_count() > 0:
-    sim.remove_object(0)
+sim.clear()
 
-while not sim.are_all_shaders_ready():
-    sim.update_shader_loading()
+if not sim.wait_shaders_ready():
+    raise RuntimeError(f"Shaders failed to load: {sim.get_shader_load_status()}")
 
 # Physics setup
 M_star, M_planet = 50.0, 1.0
@@ -31,17 +36,26 @@ planet = sim.add_object(
     r=0.3, g=0.6, b=1.0
 )
 
-# Newtonian gravity equations
+# Newtonian gravity equations: G*m*d/|d|^3 with |d|^-3 from one rsqrt
 for obj, other, mass in [(star, planet, M_planet), (planet, star, M_star)]:
     sim.set_equation(obj,
-        f"{G}*{mass}*(p[{other}].x-x)/((p[{other}].x-x)^2+(p[{other}].y-y)^2)^1.5,"
-        f"{G}*{mass}*(p[{other}].y-y)/((p[{other}].x-x)^2+(p[{other}].y-y)^2)^1.5"
+        f"let dx = p[{other}].x-x; let dy = p[{other}].y-y;"
+        f"let ir = rsqrt(dx*dx+dy*dy); let f = {G}*{mass}*ir*ir*ir;"
+        f"f*dx, f*dy"
     )
 
 # Run
-while not sim.should_close():
-    sim.process_input()
-    sim.update(0.016)
-    sim.render()
+if BENCH:
+    start = time.perf_counter()
+    for _ in range(BENCH_FRAMES):
+        sim.update(0.016)
+    sim.get_object(planet)  # Read back so pending GPU work is included
+    elapsed = time.perf_counter() - start
+    print(f"{BENCH_FRAMES} frames in {elapsed:.3f}s ({BENCH_FRAMES/elapsed:.0f} frames/s)")
+else:
+    while not sim.should_close():
+        sim.process_input()
+        sim.update(0.016)
+        sim.render()
 
 sim.cleanup()
\ No newline at end of file
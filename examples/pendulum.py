@@ -1,14 +1,19 @@
 import hyperstellar as se
 import math
+import sys
+import time
 
-sim = se.Simulation(headless=False, width=800, height=600, 
+# --bench: headless fixed-length run without rendering, for timing/regressions
+BENCH = "--bench" in sys.argv
+BENCH_FRAMES = 3600
+
+sim = se.Simulation(headless=BENCH, width=800, height=600, 
                     title="Pendulum", enable_grid=False)
 
-while not sim.are_all_shaders_ready():
-    sim.update_shader_loading()
+if not sim.wait_shaders_ready():
+    raise RuntimeError(f"Shaders failed to load: {sim.get_shader_load_status()}")
 
-while sim.object_count() > 0:
-    sim.remove_object(0)
+sim.clear()
 
 # Physical parameters
 L = 2.0      # Rod length (meters)
@@ -46,9 +51,12 @@ bob = sim.add_object(
     r=0.2, g=0.6, b=1.0  # Blue
 )
 # Spring force toward pivot + gravity + damping
+# (offset and spring coefficient bound once, shared by both components)
 sim.set_equation(bob,
-    f"{k}*(1 - {L}/sqrt((p[1].x-x)^2 + (p[1].y-y)^2 + 0.01))*(p[1].x-x) - {damping}*vx,"
-    f"{k}*(1 - {L}/sqrt((p[1].x-x)^2 + (p[1].y-y)^2 + 0.01))*(p[1].y-y) - {damping}*vy - {g}"
+    f"let dx = p[1].x-x; let dy = p[1].y-y;"
+    f"let coef = {k}*(1 - {L}*rsqrt(dx*dx + dy*dy + 0.01));"
+    f"coef*dx - {damping}*vx,"
+    f"coef*dy - {damping}*vy - {g}"
 )
 
 # Track midpoint between pivot and bob, align rotation
@@ -59,9 +67,17 @@ sim.set_equation(rod,
 )
 
 # Run simulation
-while not sim.should_close():
-    sim.process_input()
-    sim.update(0.0067)
-    sim.render()
+if BENCH:
+    start = time.perf_counter()
+    for _ in range(BENCH_FRAMES):
+        sim.update(0.0067)
+    sim.get_object(bob)  # Read back so pending GPU work is included
+    elapsed = time.perf_counter() - start
+    print(f"{BENCH_FRAMES} frames in {elapsed:.3f}s ({BENCH_FRAMES/elapsed:.0f} frames/s)")
+else:
+    while not sim.should_close():
+        sim.process_input()
+        sim.update(0.0067)
+        sim.render()
 
 sim.cleanup()
\ No newline at end of file
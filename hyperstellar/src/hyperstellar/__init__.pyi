@@ -141,6 +141,17 @@ class BatchUpdateData:
     
     def __init__(self) -> None: ...
 
+class BatchKinematicsUpdate:
+    """Position, velocity and blue-channel update; all other fields are left as-is."""
+    index: int              # Object index to update
+    x: float                # New X position
+    y: float                # New Y position
+    vx: float               # New X velocity
+    vy: float               # New Y velocity
+    b: float                # New blue color
+    
+    def __init__(self) -> None: ...
+
 class DistanceConstraint:
     """Maintain distance between two objects."""
     target_object: int      # Index of target object
@@ -290,6 +301,44 @@ class Simulation:
         """
         ...
     
+    def add_objects_batch(
+        self,
+        xs: List[float],
+        ys: List[float],
+        vx: float = 0.0,
+        vy: float = 0.0,
+        mass: float = 1.0,
+        charge: float = 0.0,
+        rotation: float = 0.0,
+        angular_velocity: float = 0.0,
+        skin: SkinType = SkinType.CIRCLE,
+        size: float = 0.3,
+        width: float = 0.5,
+        height: float = 0.3,
+        r: float = 1.0,
+        g: float = 1.0,
+        b: float = 1.0,
+        a: float = 1.0,
+        polygon_sides: int = 6
+    ) -> List[int]:
+        """
+        Add many objects at once, one per (x, y) position.
+        
+        All other properties are shared by every new object and behave as in
+        add_object().
+        
+        Args:
+            xs, ys: Initial positions (sequences of equal length, e.g. NumPy arrays)
+            vx, vy, mass, charge, ...: Shared properties, see add_object()
+            
+        Returns:
+            Indices of the newly created objects, in position order
+            
+        Raises:
+            RuntimeError: If xs and ys differ in length or the object limit would be exceeded
+        """
+        ...
+    
     def update_object(
         self,
         index: int,
@@ -348,6 +397,64 @@ class Simulation:
         """
         ...
     
+    def batch_update_kinematics(self, updates: List[BatchKinematicsUpdate]) -> None:
+        """
+        Update only position, velocity and blue channel of multiple objects.
+        
+        Args:
+            updates: List of BatchKinematicsUpdate objects
+            
+        Raises:
+            RuntimeError: If any object index is invalid
+        """
+        ...
+    
+    def mcmc_step(self, updates: List[BatchKinematicsUpdate], indices: List[int],
+                  dt: float) -> Tuple[List[float], List[float], List[float]]:
+        """
+        Apply updates, advance the simulation and read back x, y and b in one call.
+        
+        Equivalent to batch_update_kinematics(updates), update(dt) and
+        batch_get(indices), returning only the fields an MCMC accept/reject step needs.
+        
+        Args:
+            updates: List of BatchKinematicsUpdate objects applied before stepping
+            indices: Object indices to read back after stepping
+            dt: Time step to advance
+            
+        Returns:
+            Tuple of (x, y, b) lists, one entry per index
+            
+        Raises:
+            RuntimeError: If any object index is invalid
+        """
+        ...
+    
+    def mcmc_run(self, walker_ids: List[int], n_steps: int, step_size: float,
+                 seed: int, dt: float = 0.002, min_jump2: float = 1e-4) -> int:
+        """
+        Run Metropolis-Hastings steps natively, without returning to Python.
+        
+        Each step proposes gaussian jumps, advances the simulation by dt, reads
+        the probability from the blue channel and moves rejected walkers back.
+        
+        Args:
+            walker_ids: Object indices of the walkers
+            n_steps: Number of MCMC steps to run
+            step_size: Standard deviation of the gaussian proposal
+            seed: Seed for the proposal and acceptance RNG
+            dt: Time step advanced per MCMC step
+            min_jump2: Squared jump length below which a walker is left in place
+            
+        Returns:
+            Total number of accepted proposals
+            
+        Raises:
+            RuntimeError: If any object index is invalid, n_steps is negative
+                or step_size is not positive
+        """
+        ...
+    
     def remove_object(self, index: int) -> None:
         """
         Remove an object from the simulation.
@@ -360,6 +467,14 @@ class Simulation:
         """
         ...
     
+    def clear(self) -> None:
+        """
+        Remove all objects and constraints from the simulation in one call.
+        
+        Cheaper than calling remove_object(0) until object_count() is 0.
+        """
+        ...
+    
     def object_count(self) -> int:
         """
         Get current number of objects in simulation.
@@ -577,13 +692,27 @@ class Simulation:
         
         Args:
             object_index: Index of object to apply equation to
-            equation_string: Mathematical equation defining object's physics
+            equation_string: Mathematical equation defining object's physics.
+                May start with local bindings, e.g. "let d2 = x*x + y*y; -x/d2, -y/d2"
             
         Raises:
             RuntimeError: If object index is invalid or equation parsing fails
         """
         ...
     
+    def set_equation_shared(self, object_indices: List[int], equation_string: str) -> None:
+        """
+        Set the same physics equation on many objects, parsing it only once.
+        
+        Args:
+            object_indices: Indices of objects to apply equation to
+            equation_string: Mathematical equation defining the objects' physics
+            
+        Raises:
+            RuntimeError: If any object index is invalid or equation parsing fails
+        """
+        ...
+    
     # ========================================================================
     # CONSTRAINTS
     # ========================================================================
@@ -718,6 +847,31 @@ class Simulation:
         """
         ...
     
+    def wait_shaders_ready(self, timeout: float = -1.0) -> bool:
+        """
+        Block until all shaders are loaded and ready.
+        
+        Pumps shader loading natively with the GIL released, replacing a
+        Python polling loop around update_shader_loading(). Returns early if
+        a shader fails to load, and can be interrupted with Ctrl+C.
+        
+        Args:
+            timeout: Maximum seconds to wait (negative waits indefinitely)
+            
+        Returns:
+            True if shaders are ready, False if a shader failed or the timeout expired
+        """
+        ...
+    
+    def shader_load_failed(self) -> bool:
+        """
+        Check if a shader failed to compile or link.
+        
+        Returns:
+            True if any shader failed to load
+        """
+        ...
+    
     def get_shader_load_progress(self) -> float:
         """
         Get overall shader loading progress.
@@ -1,5 +1,6 @@
 #pragma once
 #include "parser.h"
+#include "objects.h"
 #include <iostream>
 #include <vector>
 #include <unordered_map>
@@ -44,6 +45,9 @@ namespace GPUTokens {
     const int TOKEN_CLOSE_PAREN = 31;
     const int TOKEN_COMMA = 32;
     const int TOKEN_DERIVATIVE = 33;
+    const int TOKEN_LOCAL_STORE = 34;
+    const int TOKEN_LOCAL_LOAD = 35;
+    const int TOKEN_RSQRT = 36;
 }
 
 // ============================================================================
@@ -177,6 +181,7 @@ static const std::unordered_map<TokenType, int> s_tokenTypeMap = {
     {TOKEN_COS, GPUTokens::TOKEN_COS},
     {TOKEN_TAN, GPUTokens::TOKEN_TAN},
     {TOKEN_SQRT, GPUTokens::TOKEN_SQRT},
+    {TOKEN_RSQRT, GPUTokens::TOKEN_RSQRT},
     {TOKEN_LOG, GPUTokens::TOKEN_LOG},
     {TOKEN_EXP, GPUTokens::TOKEN_EXP},
     {TOKEN_ABS, GPUTokens::TOKEN_ABS},
@@ -311,6 +316,15 @@ inline void serializeTokensToGPU(
                 break;
             }
             
+            case TOKEN_LOCAL_STORE:
+            case TOKEN_LOCAL_LOAD: {
+                // let binding slot access: [type, slot]
+                outTokenBuffer.push_back(token.type == TOKEN_LOCAL_STORE ?
+                    GPUTokens::TOKEN_LOCAL_STORE : GPUTokens::TOKEN_LOCAL_LOAD);
+                outTokenBuffer.push_back(token.local_slot);
+                break;
+            }
+            
             case TOKEN_DERIVATIVE: {
                 // Serialize derivative token
                 int wrtVarHash = hashVariableName(token.derivative_wrt);
@@ -143,6 +143,7 @@ namespace Objects
     // Object management
     void AddObject();
     void RemoveObject(int index = -1);
+    void RemoveAllObjects();
     void ResetToInitialConditions();
 
     // System parameters
@@ -154,6 +155,7 @@ namespace Objects
     bool IsComputeShaderReady();
     bool IsQuadShaderReady();
     bool AreAllShadersReady();
+    bool HasShaderLoadFailed();
     float GetShaderLoadProgress();
     std::string GetShaderLoadStatusMessage();
 
@@ -41,7 +41,10 @@ enum TokenType {
     TOKEN_OPEN_PAREN,
     TOKEN_CLOSE_PAREN,
     TOKEN_COMMA,
-    TOKEN_DERIVATIVE
+    TOKEN_DERIVATIVE,
+    TOKEN_LOCAL_STORE,
+    TOKEN_LOCAL_LOAD,
+    TOKEN_RSQRT
 };
 
 // ============================================================================
@@ -75,6 +78,9 @@ struct Token {
     DerivativeMethod derivative_method = DERIV_METHOD_NUMERICAL;
     std::vector<Token> derivative_expr_tokens;  // ADDED: Expression to differentiate
     
+    // For TOKEN_LOCAL_STORE / TOKEN_LOCAL_LOAD (let bindings)
+    int local_slot = -1;
+    
     // Constructors
     Token() : type(TOKEN_NUMBER), numeric_value(0.0f) {}
     
@@ -124,8 +130,13 @@ public:
     bool isValidDerivativeWRT(const std::string& varName) const;
     VariableDomain getVariableDomain(const std::string& varName) const;
     
+    // Local bindings introduced with "let name = expr;"
+    void registerLocal(const std::string& name, int slot);
+    int getLocalSlot(const std::string& name) const;  // -1 if not a local
+    
 private:
     std::unordered_map<std::string, VariableDef> m_variables;
+    std::unordered_map<std::string, int> m_locals;
     std::unordered_map<std::string, std::vector<std::string>> m_objectTypes;
 };
 
@@ -177,6 +188,7 @@ std::vector<Token> infixToRPN(
 
 // Main entry point - now supports extended format:
 // "ax, ay, angular_accel, r, g, b, a"
+// optionally preceded by local bindings: "let d2 = x*x + y*y; -x/d2, -y/d2"
 ParsedEquation ParseEquation(
     const std::string& equation_string, 
     const ParserContext& context
@@ -3,6 +3,8 @@
 #include <pybind11/functional.h>
 #include <pybind11/gil.h>
 #include <string>
+#include <chrono>
+#include <algorithm>
 #include "simulation_wrapper.h"
 
 namespace py = pybind11;
@@ -231,6 +233,15 @@ PYBIND11_MODULE(stellar, m)
         .def_readwrite("b", &BatchUpdateData::b)
         .def_readwrite("a", &BatchUpdateData::a);
 
+    py::class_<BatchKinematicsUpdate>(m, "BatchKinematicsUpdate", "Position/velocity/probability update")
+        .def(py::init<>())
+        .def_readwrite("index", &BatchKinematicsUpdate::index)
+        .def_readwrite("x", &BatchKinematicsUpdate::x)
+        .def_readwrite("y", &BatchKinematicsUpdate::y)
+        .def_readwrite("vx", &BatchKinematicsUpdate::vx)
+        .def_readwrite("vy", &BatchKinematicsUpdate::vy)
+        .def_readwrite("b", &BatchKinematicsUpdate::b);
+
     // =========================================================================
     // CONSTRAINT TYPES
     // =========================================================================
@@ -411,6 +422,33 @@ PYBIND11_MODULE(stellar, m)
                  >>> obj_id = sim.add_object(x=10, y=5, mass=50, skin=SkinType.CIRCLE)
              )pbdoc")
 
+        .def("add_objects_batch", &SimulationWrapper::add_objects_batch,
+            py::arg("xs"), py::arg("ys"),
+            py::arg("vx") = 0.0f, py::arg("vy") = 0.0f,
+            py::arg("mass") = 1.0f, py::arg("charge") = 0.0f,
+            py::arg("rotation") = 0.0f, py::arg("angular_velocity") = 0.0f,
+            py::arg("skin") = PySkinType::PY_SKIN_CIRCLE,
+            py::arg("size") = 0.3f,
+            py::arg("width") = 0.5f, py::arg("height") = 0.3f,
+            py::arg("r") = 1.0f, py::arg("g") = 1.0f,
+            py::arg("b") = 1.0f, py::arg("a") = 1.0f,
+            py::arg("polygon_sides") = 6,
+            R"pbdoc(
+             Add many objects at once, one per (x, y) position.
+             
+             All other properties are shared and take the same defaults as add_object.
+             
+             Args:
+                 xs,ys (list[float]): Initial positions (same length)
+                 vx,vy,mass,charge,...: Shared properties, as in add_object
+                 
+             Returns:
+                 list[int]: Object IDs in the order of the positions
+                 
+             Example:
+                 >>> ids = sim.add_objects_batch(xs, ys, size=0.15, r=0.2, g=0.5, b=0.9)
+             )pbdoc")
+
         .def("update_object", &SimulationWrapper::update_object,
             py::arg("index"),
             py::arg("x"), py::arg("y"),
@@ -463,10 +501,79 @@ PYBIND11_MODULE(stellar, m)
                  >>> sim.batch_update(updates)
              )pbdoc")
 
+        .def("batch_update_kinematics", &SimulationWrapper::batch_update_kinematics,
+            py::arg("updates"),
+            R"pbdoc(
+             Update position, velocity and blue channel of multiple objects.
+             
+             Mass, charge, size, rotation and the remaining color channels are
+             left untouched, so each update carries 6 fields instead of 15.
+             
+             Args:
+                 updates (list[BatchKinematicsUpdate]): List of kinematic updates
+                 
+             Example:
+                 >>> u = BatchKinematicsUpdate()
+                 >>> u.index, u.x, u.y, u.b = 0, 1.0, 2.0, 0.9
+                 >>> sim.batch_update_kinematics([u])
+             )pbdoc")
+
+        .def("mcmc_step", &SimulationWrapper::mcmc_step,
+            py::arg("updates"), py::arg("indices"), py::arg("dt"),
+            R"pbdoc(
+             Apply a batch update, advance the simulation and read back results in one call.
+             
+             Equivalent to batch_update_kinematics(updates), update(dt) and
+             batch_get(indices), but only the x, y and b (blue channel) fields are returned.
+             
+             Args:
+                 updates (list[BatchKinematicsUpdate]): Updates to apply before stepping
+                 indices (list[int]): Object indices to read back after stepping
+                 dt (float): Time step to advance
+                 
+             Returns:
+                 tuple: (x, y, b) lists, one entry per index
+                 
+             Example:
+                 >>> xs, ys, probs = sim.mcmc_step(updates, walker_ids, 0.002)
+             )pbdoc")
+
+        .def("mcmc_run", &SimulationWrapper::mcmc_run,
+            py::arg("walker_ids"), py::arg("n_steps"), py::arg("step_size"),
+            py::arg("seed"), py::arg("dt") = 0.002f, py::arg("min_jump2") = 1e-4f,
+            R"pbdoc(
+             Run Metropolis-Hastings steps natively for a set of walkers.
+             
+             Each step draws gaussian proposals, advances the simulation by dt,
+             reads the probability from the blue channel and moves rejected walkers
+             back, all without returning to Python. Walkers are left at their
+             accepted positions.
+             
+             Args:
+                 walker_ids (list[int]): Object indices of the walkers
+                 n_steps (int): Number of MCMC steps to run
+                 step_size (float): Standard deviation of the gaussian proposal
+                 seed (int): Seed for the proposal and acceptance RNG
+                 dt (float): Time step advanced per MCMC step
+                 min_jump2 (float): Squared jump length below which a walker is left in place
+                 
+             Returns:
+                 int: Total number of accepted proposals
+                 
+             Raises:
+                 RuntimeError: If an index is invalid, n_steps < 0 or step_size <= 0
+                 
+             Example:
+                 >>> accepted = sim.mcmc_run(walker_ids, 10, 0.5, seed=frame)
+             )pbdoc")
+
         .def("remove_object", &SimulationWrapper::remove_object,
             py::arg("index"),
             "Remove an object by ID")
 
+        .def("clear", &SimulationWrapper::clear,
+            "Remove all objects and constraints from the simulation")
+
         .def("object_count", &SimulationWrapper::object_count,
             "Get number of objects in simulation")
 
@@ -520,13 +627,31 @@ PYBIND11_MODULE(stellar, m)
              Equation syntax supports:
              - Variables: x, y, vx, vy, mass, charge, time
              - Object references: p[ID].x, p[ID].y, p[ID].mass
-             - Functions: sin, cos, tan, sqrt, exp, log
+             - Functions: sin, cos, tan, sqrt, rsqrt, exp, log
              - Operators: +, -, *, /, ^ (power)
+             - Local bindings: "let d2 = x*x + y*y; -x/d2, -y/d2" (up to 16,
+               evaluated once per object and shared across components; not usable inside D())
                  
              Example:
                  >>> sim.set_equation(0, "0.1*mass*(p[1].x - x)/distance^3")
              )pbdoc")
 
+        .def("set_equation_shared", &SimulationWrapper::set_equation_shared,
+            py::arg("object_indices"), py::arg("equation_string"),
+            R"pbdoc(
+             Set the same physics equation on many objects.
+             
+             The equation is parsed and uploaded once; every object then
+             references the same compiled equation.
+             
+             Args:
+                 object_indices (list[int]): Object IDs
+                 equation_string (str): Physics equation
+                 
+             Example:
+                 >>> sim.set_equation_shared(walker_ids, "0, 0, 0, 0.3, 0.6, exp(-(x*x+y*y)), 1")
+             )pbdoc")
+
         // Constraints
         .def("add_distance_constraint", &SimulationWrapper::add_distance_constraint,
             py::arg("object_index"), py::arg("constraint"),
@@ -726,6 +851,61 @@ PYBIND11_MODULE(stellar, m)
             },
             "Check if all shaders are loaded")
 
+        .def("wait_shaders_ready", [](SimulationWrapper& self, float timeout)
+            {
+                // Wait in short GIL-released slices so Ctrl+C is still honoured
+                const float slice = 0.1f;
+                auto start = std::chrono::steady_clock::now();
+                while (true)
+                {
+                    float wait = slice;
+                    if (timeout >= 0.0f)
+                    {
+                        std::chrono::duration<float> elapsed = std::chrono::steady_clock::now() - start;
+                        wait = std::max(0.0f, std::min(slice, timeout - elapsed.count()));
+                    }
+
+                    bool ready;
+                    {
+                        py::gil_scoped_release release;
+                        ready = self.wait_shaders_ready(wait);
+                    }
+
+                    if (ready || self.shader_load_failed())
+                        return ready;
+
+                    if (PyErr_CheckSignals() != 0)
+                        throw py::error_already_set();
+
+                    if (timeout >= 0.0f)
+                    {
+                        std::chrono::duration<float> elapsed = std::chrono::steady_clock::now() - start;
+                        if (elapsed.count() >= timeout)
+                            return false;
+                    }
+                }
+            },
+            py::arg("timeout") = -1.0f,
+            R"pbdoc(
+             Block until all shaders are loaded, pumping the loader natively.
+             
+             Returns early with False if a shader fails to load. The wait can be
+             interrupted with Ctrl+C.
+             
+             Args:
+                 timeout (float): Maximum seconds to wait (negative waits indefinitely)
+                 
+             Returns:
+                 bool: True if all shaders are ready, False on failure or timeout
+                 
+             Example:
+                 >>> if not sim.wait_shaders_ready(10.0):
+                 >>>     print(sim.get_shader_load_status())
+             )pbdoc")
+
+        .def("shader_load_failed", &SimulationWrapper::shader_load_failed,
+            "Check if a shader failed to compile or link")
+
         .def("get_shader_load_progress", [](const SimulationWrapper& self)
             {
                 py::gil_scoped_release release;
@@ -15,6 +15,9 @@
 #include <algorithm>
 #include <sstream>
 #include <utility> 
+#include <chrono>
+#include <thread>
+#include <random>
 
 namespace
 {
@@ -774,6 +777,39 @@ int SimulationWrapper::add_object(
     return objectID;
 }
 
+// Add multiple objects at the given positions, sharing all other properties
+std::vector<int> SimulationWrapper::add_objects_batch(
+    const std::vector<float>& xs, const std::vector<float>& ys,
+    float vx, float vy,
+    float mass, float charge,
+    float rotation, float angular_velocity,
+    PySkinType skin,
+    float size,
+    float width, float height,
+    float r, float g, float b, float a,
+    int polygon_sides)
+{
+    ensure_initialized();
+
+    if (xs.size() != ys.size())
+        throw std::runtime_error("add_objects_batch: xs and ys must have the same length");
+
+    if (Objects::GetNumObjects() + static_cast<int>(xs.size()) > Objects::MAX_OBJECTS)
+        throw std::runtime_error("Maximum object limit reached");
+
+    std::vector<int> ids;
+    ids.reserve(xs.size());
+
+    for (size_t i = 0; i < xs.size(); ++i)
+    {
+        ids.push_back(add_object(xs[i], ys[i], vx, vy, mass, charge,
+                                 rotation, angular_velocity, skin, size,
+                                 width, height, r, g, b, a, polygon_sides));
+    }
+
+    return ids;
+}
+
 // Update properties of an existing object
 void SimulationWrapper::update_object(
     int index,
@@ -843,6 +879,13 @@ void SimulationWrapper::remove_object(int index)
     Objects::RemoveObject(index);
 }
 
+// Remove all objects (and their constraints) from the simulation
+void SimulationWrapper::clear()
+{
+    ensure_initialized();
+    Objects::RemoveAllObjects();
+}
+
 // Get current number of objects in simulation
 int SimulationWrapper::object_count() const
 {
@@ -1053,6 +1096,177 @@ void SimulationWrapper::batch_update(const std::vector<BatchUpdateData>& updates
     glFlush();
 }
 
+// Batch update of position, velocity and color.b only
+void SimulationWrapper::batch_update_kinematics(const std::vector<BatchKinematicsUpdate>& updates) {
+    ensure_initialized();
+
+    if (updates.empty()) {
+        return;
+    }
+
+    const int numObjects = Objects::GetNumObjects();
+    for (const auto& update : updates) {
+        if (update.index < 0 || update.index >= numObjects) {
+            throw std::runtime_error("Invalid object index in batch_update_kinematics: " + std::to_string(update.index));
+        }
+    }
+
+    Object* mapped0 = Objects::GetObjectDataDirectMutable(0);
+    Object* mapped1 = Objects::GetObjectDataDirectMutable(1);
+
+    if (mapped0 && mapped1) {
+        // Persistent mapping: write the touched fields in place in both buffers
+        for (const auto& update : updates) {
+            for (Object* base : { mapped0, mapped1 }) {
+                Object& p = base[update.index];
+                p.position = glm::vec2(update.x, update.y);
+                p.velocity = glm::vec2(update.vx, update.vy);
+                p.color.b = update.b;
+            }
+        }
+    }
+    else {
+        std::vector<Object> objects;
+        Objects::FetchToCPU(m_currentBuffer, objects);
+
+        for (const auto& update : updates) {
+            if (update.index >= static_cast<int>(objects.size())) {
+                throw std::runtime_error("Invalid object index in batch_update_kinematics: " + std::to_string(update.index));
+            }
+
+            Object& p = objects[update.index];
+            p.position = glm::vec2(update.x, update.y);
+            p.velocity = glm::vec2(update.vx, update.vy);
+            p.color.b = update.b;
+
+            Objects::UpdateObjectCPU(update.index, p);
+        }
+    }
+
+    // Ensure GPU synchronization
+    glMemoryBarrier(GL_SHADER_STORAGE_BARRIER_BIT);
+    glFlush();
+}
+
+// Fused MCMC step: apply kinematic updates, advance dt, then read back x, y and color.b
+std::tuple<std::vector<float>, std::vector<float>, std::vector<float>> SimulationWrapper::mcmc_step(
+    const std::vector<BatchKinematicsUpdate>& updates,
+    const std::vector<int>& indices,
+    float dt)
+{
+    ensure_initialized();
+
+    batch_update_kinematics(updates);
+    update(dt);
+
+    std::vector<float> xs, ys, bs;
+    xs.reserve(indices.size());
+    ys.reserve(indices.size());
+    bs.reserve(indices.size());
+
+    if (indices.empty()) {
+        return std::make_tuple(std::move(xs), std::move(ys), std::move(bs));
+    }
+
+    // Single fetch from the freshly written buffer, only three fields extracted
+    std::vector<Object> allObjects;
+    Objects::FetchToCPU(m_currentBuffer, allObjects);
+
+    for (int index : indices) {
+        if (index < 0 || index >= static_cast<int>(allObjects.size())) {
+            throw std::runtime_error("Invalid object index in mcmc_step: " + std::to_string(index));
+        }
+
+        const Object& p = allObjects[index];
+        xs.push_back(p.position.x);
+        ys.push_back(p.position.y);
+        bs.push_back(p.color.b);
+    }
+
+    return std::make_tuple(std::move(xs), std::move(ys), std::move(bs));
+}
+
+// Native Metropolis-Hastings loop: propose, step, read color.b, accept/reject
+int SimulationWrapper::mcmc_run(const std::vector<int>& walker_ids, int n_steps,
+    float step_size, unsigned int seed, float dt, float min_jump2)
+{
+    ensure_initialized();
+
+    if (n_steps < 0)
+        throw std::runtime_error("n_steps must be non-negative");
+    if (!(step_size > 0.0f))
+        throw std::runtime_error("step_size must be positive");
+
+    const size_t n = walker_ids.size();
+    if (n == 0 || n_steps == 0)
+        return 0;
+
+    // Current chain state (accepted position and probability) per walker
+    std::vector<float> curX(n), curY(n), curP(n);
+    {
+        std::vector<Object> allObjects;
+        Objects::FetchToCPU(m_currentBuffer, allObjects);
+
+        for (size_t i = 0; i < n; ++i) {
+            int index = walker_ids[i];
+            if (index < 0 || index >= static_cast<int>(allObjects.size())) {
+                throw std::runtime_error("Invalid object index in mcmc_run: " + std::to_string(index));
+            }
+
+            const Object& p = allObjects[index];
+            curX[i] = p.position.x;
+            curY[i] = p.position.y;
+            curP[i] = std::max(0.001f, p.color.b);
+        }
+    }
+
+    std::mt19937 rng(seed);
+    std::normal_distribution<float> normal(0.0f, step_size);
+    std::uniform_real_distribution<float> uniform(0.0f, 1.0f);
+
+    std::vector<BatchKinematicsUpdate> proposals, rejects;
+    std::vector<size_t> moved;
+    proposals.reserve(n);
+    rejects.reserve(n);
+    moved.reserve(n);
+
+    int accepted = 0;
+    for (int step = 0; step < n_steps; ++step) {
+        proposals.clear();
+        rejects.clear();
+        moved.clear();
+
+        for (size_t i = 0; i < n; ++i) {
+            float dx = normal(rng);
+            float dy = normal(rng);
+            if (dx * dx + dy * dy <= min_jump2)  // Negligible jump: leave walker in place
+                continue;
+
+            proposals.push_back({ walker_ids[i], curX[i] + dx, curY[i] + dy, 0.0f, 0.0f, curP[i] });
+            moved.push_back(i);
+        }
+
+        auto [xs, ys, bs] = mcmc_step(proposals, walker_ids, dt);
+
+        for (size_t i : moved) {
+            float pp = std::max(0.001f, bs[i]);
+            if (uniform(rng) < std::min(1.0f, pp / curP[i])) {
+                curX[i] = xs[i];
+                curY[i] = ys[i];
+                curP[i] = pp;
+                ++accepted;
+            }
+            else {
+                rejects.push_back({ walker_ids[i], curX[i], curY[i], 0.0f, 0.0f, curP[i] });
+            }
+        }
+
+        batch_update_kinematics(rejects);
+    }
+
+    return accepted;
+}
+
 // Set angular velocity of an object
 void SimulationWrapper::set_angular_velocity(int index, float angular_velocity)
 {
@@ -1201,6 +1415,32 @@ void SimulationWrapper::set_equation(int object_index, const std::string& equati
     }
 }
 
+// Set one physics equation on many objects, parsing it only once
+void SimulationWrapper::set_equation_shared(const std::vector<int>& object_indices, const std::string& equation_string)
+{
+    ensure_initialized();
+
+    for (int index : object_indices) {
+        if (index < 0 || index >= Objects::GetNumObjects())
+            throw std::runtime_error("Invalid object index in set_equation_shared: " + std::to_string(index));
+    }
+
+    ParsedEquation eq;
+    try
+    {
+        ParserContext context;
+        eq = ParseEquation(equation_string, context);
+    }
+    catch (const std::exception& e)
+    {
+        throw std::runtime_error("Equation parsing failed: " + std::string(e.what()));
+    }
+
+    // First call registers the equation; the rest hit the string-to-ID cache
+    for (int index : object_indices)
+        Objects::SetEquation(equation_string, eq, index);
+}
+
 // Add distance constraint between two objects
 void SimulationWrapper::add_distance_constraint(int object_index, const DistanceConstraint& constraint)
 {
@@ -1400,9 +1640,7 @@ void SimulationWrapper::load_from_file(const std::string& filename)
 
     // Clear existing simulation
     reset();
-    clear_all_constraints();
-    while (object_count() > 0)
-        remove_object(0);
+    clear();
 
     std::string line;
     std::string current_section;
@@ -1644,11 +1882,9 @@ void SimulationWrapper::run_batch(
 
         // Reset simulation
         reset();
-        clear_all_constraints();
 
-        // Remove any existing objects
-        while (object_count() > 0)
-            remove_object(0);
+        // Remove any existing objects and constraints
+        clear();
 
         // Create objects from configuration
         for (const auto& pconfig : config.objects)
@@ -1773,6 +2009,49 @@ bool SimulationWrapper::are_all_shaders_ready() const
     return Objects::AreAllShadersReady();
 }
 
+// Check if any shader failed to load (waiting further will not help)
+bool SimulationWrapper::shader_load_failed() const
+{
+    ensure_initialized();
+    return Objects::HasShaderLoadFailed();
+}
+
+// Pump shader loading until all shaders are ready, one fails, or timeout (seconds, < 0 = no limit) expires
+bool SimulationWrapper::wait_shaders_ready(float timeout)
+{
+    ensure_initialized();
+
+    if (m_window)
+        glfwMakeContextCurrent(static_cast<GLFWwindow*>(m_window));
+
+    auto start = std::chrono::steady_clock::now();
+    while (!Objects::AreAllShadersReady())
+    {
+        Objects::UpdateShaderLoadingStatus();
+
+        if (Objects::HasShaderLoadFailed())
+            return false;
+
+        if (!m_headless && m_window)
+            glfwPollEvents();
+
+        glFlush();
+
+        if (timeout >= 0.0f)
+        {
+            std::chrono::duration<float> elapsed = std::chrono::steady_clock::now() - start;
+            if (elapsed.count() >= timeout)
+                break;
+        }
+
+        // Sleep briefly so the pump doesn't spin a core while the loader thread works
+        std::this_thread::sleep_for(std::chrono::milliseconds(1));
+    }
+
+    glFinish();
+    return Objects::AreAllShadersReady();
+}
+
 // Get overall shader loading progress (0.0 to 1.0)
 float SimulationWrapper::get_shader_load_progress() const
 {
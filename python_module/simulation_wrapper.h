@@ -6,6 +6,7 @@
 #include <functional>
 #include <fstream>
 #include <vector>
+#include <tuple>
 
 // Forward declarations to avoid including all headers
 struct ObjectState;
@@ -60,6 +61,16 @@ struct BatchUpdateData {
     float a;
 };
 
+// Position, velocity and probability channel only; style/size stay as set by add_object
+struct BatchKinematicsUpdate {
+    int index;
+    float x;
+    float y;
+    float vx;
+    float vy;
+    float b;
+};
+
 struct BatchGetData {
     float x;
     float y;
@@ -192,7 +203,20 @@ public:
         float r = 1.0f, float g = 1.0f, float b = 1.0f, float a = 1.0f,
         int polygon_sides = 6);
 
+    // Add many objects that share every property except position
+    std::vector<int> add_objects_batch(
+        const std::vector<float> &xs, const std::vector<float> &ys,
+        float vx = 0.0f, float vy = 0.0f,
+        float mass = 1.0f, float charge = 0.0f,
+        float rotation = 0.0f, float angular_velocity = 0.0f,
+        PySkinType skin = PySkinType::PY_SKIN_CIRCLE,
+        float size = 0.3f,
+        float width = 0.5f, float height = 0.3f,
+        float r = 1.0f, float g = 1.0f, float b = 1.0f, float a = 1.0f,
+        int polygon_sides = 6);
+
     void remove_object(int index);
+    void clear();
     int object_count() const;
     ObjectState get_object(int index) const;
 
@@ -209,6 +233,18 @@ public:
     //batch get and update
     std::vector<BatchGetData> batch_get(const std::vector<int>& indices) const;
     void batch_update(const std::vector<BatchUpdateData>& updates);
+    void batch_update_kinematics(const std::vector<BatchKinematicsUpdate>& updates);
+
+    // Fused batch_update_kinematics + update(dt) + readback of x, y and color.b
+    std::tuple<std::vector<float>, std::vector<float>, std::vector<float>> mcmc_step(
+        const std::vector<BatchKinematicsUpdate>& updates,
+        const std::vector<int>& indices,
+        float dt);
+
+    // Run n_steps Metropolis-Hastings steps natively; returns accepted proposals
+    int mcmc_run(const std::vector<int>& walker_ids, int n_steps,
+        float step_size, unsigned int seed, float dt = 0.002f,
+        float min_jump2 = 1e-4f);
 
     // NEW: Convenience methods for specific properties
     void set_rotation(int index, float rotation);
@@ -220,6 +256,7 @@ public:
 
     // Equations
     void set_equation(int object_index, const std::string &equation_string);
+    void set_equation_shared(const std::vector<int> &object_indices, const std::string &equation_string);
 
     // Constraints
     void add_distance_constraint(int object_index, const DistanceConstraint &constraint);
@@ -267,6 +304,8 @@ public:
     // Shader loading status
     void update_shader_loading();
     bool are_all_shaders_ready() const;
+    bool wait_shaders_ready(float timeout = -1.0f);
+    bool shader_load_failed() const;
     float get_shader_load_progress() const;
     std::string get_shader_load_status() const;
 };
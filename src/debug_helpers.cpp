@@ -66,6 +66,7 @@ const char* GetTokenTypeName(TokenType type) {
         case TOKEN_COS: return "COS";
         case TOKEN_TAN: return "TAN";
         case TOKEN_SQRT: return "SQRT";
+        case TOKEN_RSQRT: return "RSQRT";
         case TOKEN_LOG: return "LOG";
         case TOKEN_EXP: return "EXP";
         case TOKEN_ABS: return "ABS";
@@ -87,6 +88,8 @@ const char* GetTokenTypeName(TokenType type) {
         case TOKEN_CLOSE_PAREN: return "CLOSE_PAREN";
         case TOKEN_COMMA: return "COMMA";
         case TOKEN_DERIVATIVE: return "DERIVATIVE";
+        case TOKEN_LOCAL_STORE: return "LOCAL_STORE";
+        case TOKEN_LOCAL_LOAD: return "LOCAL_LOAD";
         default: return "UNKNOWN_TYPE";
     }
 }
@@ -119,6 +122,11 @@ void DebugPrintParsedEquation(const std::string& name,
                 std::cout << " D(expr, " << token.derivative_wrt << ", " << token.derivative_order << ")";
                 break;
                 
+            case TOKEN_LOCAL_STORE:
+            case TOKEN_LOCAL_LOAD:
+                std::cout << " slot " << token.local_slot;
+                break;
+                
             default:
                 // Just show the type name
                 break;
@@ -65,6 +65,7 @@ static AsyncShaderLoader g_computeLoader;
 static AsyncShaderLoader g_quadLoader;
 static bool g_computeShaderReady = false;
 static bool g_quadShaderReady = false;
+static bool g_shaderLoadFailed = false;  // Set by a loader error callback
 
 // Helper function to safely delete buffers
 static void SafeDeleteBuffers(GLuint* buf, GLsizei n)
@@ -711,6 +712,7 @@ bool Objects::Init(void* glfwWindow)
             {
                 std::cerr << "\n[Objects] Compute shader FAILED: " << error << std::endl;
                 g_computeShaderReady = false;
+                g_shaderLoadFailed = true;
             });
     }
 
@@ -730,6 +732,7 @@ bool Objects::Init(void* glfwWindow)
             {
                 std::cerr << "\n[Objects] Quad shader FAILED: " << error << std::endl;
                 g_quadShaderReady = false;
+                g_shaderLoadFailed = true;
             });
     }
 
@@ -1250,6 +1253,15 @@ void Objects::UpdateObjectCPU(int index, const Object& newData)
     }
 }
 
+// ============================================================================
+// Remove every object (and all constraints) in one pass
+// ============================================================================
+void Objects::RemoveAllObjects()
+{
+    ClearAllConstraints();
+    g_numObjects = 0;
+}
+
 // ============================================================================
 // Set default object type for new objects
 // ============================================================================
@@ -1320,6 +1332,7 @@ void Objects::Cleanup()
 
     g_computeShaderReady = false;
     g_quadShaderReady = false;
+    g_shaderLoadFailed = false;
 
     // Delete all buffers and VAOs
     SafeDeleteBuffers(g_objectSSBO, 2);
@@ -1384,6 +1397,14 @@ bool Objects::AreAllShadersReady()
     return g_computeShaderReady && g_quadShaderReady;
 }
 
+// ============================================================================
+// Check if any shader failed to load
+// ============================================================================
+bool Objects::HasShaderLoadFailed()
+{
+    return g_shaderLoadFailed;
+}
+
 // ============================================================================
 // Get overall shader loading progress
 // ============================================================================
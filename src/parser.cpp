@@ -1,4 +1,5 @@
 #include "parser.h"
+#include "gpu_serializer.h"
 #include <sstream>
 #include <cctype>
 #include <algorithm>
@@ -93,6 +94,17 @@ ParserContext::VariableDomain ParserContext::getVariableDomain(const std::string
     return it != m_variables.end() ? it->second.domain : DOMAIN_SCALAR;
 }
 
+void ParserContext::registerLocal(const std::string &name, int slot)
+{
+    m_locals[name] = slot;
+}
+
+int ParserContext::getLocalSlot(const std::string &name) const
+{
+    auto it = m_locals.find(name);
+    return it != m_locals.end() ? it->second : -1;
+}
+
 // ============================================================================
 // OPERATOR PRECEDENCE AND ASSOCIATIVITY
 // ============================================================================
@@ -121,6 +133,7 @@ namespace
         {TOKEN_COS, 1}, 
         {TOKEN_TAN, 1}, 
         {TOKEN_SQRT, 1}, 
+        {TOKEN_RSQRT, 1},
         {TOKEN_LOG, 1},
         {TOKEN_EXP, 1},
         {TOKEN_ABS, 1},
@@ -146,6 +159,7 @@ namespace
         {"cos", TOKEN_COS}, 
         {"tan", TOKEN_TAN}, 
         {"sqrt", TOKEN_SQRT}, 
+        {"rsqrt", TOKEN_RSQRT},
         {"log", TOKEN_LOG}, 
         {"exp", TOKEN_EXP}, 
         {"abs", TOKEN_ABS}, 
@@ -165,6 +179,12 @@ namespace
         {"step", TOKEN_STEP}
     };
 
+    // Maximum number of let bindings per equation (must match MAX_LOCAL_SLOTS in shader)
+    const int s_maxLocalSlots = 16;
+
+    // Maximum serialized words per equation component (must match MAX_COMPONENT_TOKENS in shader)
+    const int s_maxComponentTokens = 1000;
+
     // Helper function to trim whitespace
     std::string trim(const std::string& str) {
         size_t first = str.find_first_not_of(" \t\n\r");
@@ -285,6 +305,16 @@ std::vector<Token> parseDerivativeCall(const std::string &expression, size_t sta
     auto expr_tokens = tokenizeExpression(expr_str, context);
     auto rpn_expr = infixToRPN(expr_tokens);
 
+    // The derivative evaluator re-runs the expression with perturbed inputs,
+    // so it cannot read locals stored from unperturbed values
+    for (const auto &token : rpn_expr)
+    {
+        if (token.type == TOKEN_LOCAL_LOAD)
+        {
+            throw std::runtime_error("Local bindings cannot be used inside D()");
+        }
+    }
+
     // Create NUMERICAL derivative instruction token
     Token deriv_token(TOKEN_DERIVATIVE);
     deriv_token.derivative_wrt = wrt_var;
@@ -329,6 +359,17 @@ std::vector<Token> tokenizeExpression(const std::string &expression, const Parse
             return;
         }
 
+        // Check if it's a local binding
+        int localSlot = context.getLocalSlot(currentLexeme);
+        if (localSlot >= 0)
+        {
+            Token localToken(TOKEN_LOCAL_LOAD);
+            localToken.local_slot = localSlot;
+            tokens.push_back(localToken);
+            currentLexeme.clear();
+            return;
+        }
+
         // Check if it's a number
         try
         {
@@ -507,7 +548,8 @@ std::vector<Token> infixToRPN(const std::vector<Token> &infixTokens)
     {
         // Operands go directly to output
         if (token.type == TOKEN_NUMBER || token.type == TOKEN_VARIABLE ||
-            token.type == TOKEN_OBJECT_REF || token.type == TOKEN_DERIVATIVE)
+            token.type == TOKEN_OBJECT_REF || token.type == TOKEN_DERIVATIVE ||
+            token.type == TOKEN_LOCAL_LOAD)
         {
             output.push_back(token);
         }
@@ -622,12 +664,81 @@ ParsedEquation ParseEquation(const std::string &equation_string, const ParserCon
 {
     ParsedEquation result;
 
+    // Split off leading local bindings: "let name = expr; ...; ax, ay, ..."
+    std::vector<std::string> statements;
+    std::string statement;
+    int depth = 0;
+
+    for (char c : equation_string) {
+        if (c == '(') depth++;
+        else if (c == ')') depth--;
+
+        if (c == ';' && depth == 0) {
+            statements.push_back(trim(statement));
+            statement.clear();
+        }
+        else {
+            statement += c;
+        }
+    }
+    std::string componentString = trim(statement);
+
+    ParserContext localContext = context;
+    std::vector<std::vector<Token>> bindings;
+
+    for (const auto &stmt : statements)
+    {
+        if (stmt.empty())
+            continue;
+
+        if (stmt.compare(0, 3, "let") != 0 || stmt.length() < 4 || !std::isspace(static_cast<unsigned char>(stmt[3])))
+        {
+            throw std::runtime_error("Expected 'let name = expr' before ';': " + stmt);
+        }
+
+        size_t eqPos = stmt.find('=');
+        if (eqPos == std::string::npos)
+        {
+            throw std::runtime_error("Missing '=' in let binding: " + stmt);
+        }
+
+        std::string name = trim(stmt.substr(3, eqPos - 3));
+        std::string expr = trim(stmt.substr(eqPos + 1));
+
+        bool validName = !name.empty() &&
+                         (std::isalpha(static_cast<unsigned char>(name[0])) || name[0] == '_');
+        for (char nc : name)
+        {
+            if (!std::isalnum(static_cast<unsigned char>(nc)) && nc != '_')
+                validName = false;
+        }
+        if (!validName || name == "p" || name == "D" ||
+            s_functionMap.count(name) || localContext.isValidVariable(name) ||
+            localContext.getLocalSlot(name) >= 0)
+        {
+            throw std::runtime_error("Invalid or reserved let binding name: " + name);
+        }
+        if (expr.empty())
+        {
+            throw std::runtime_error("Empty expression in let binding: " + name);
+        }
+        if (static_cast<int>(bindings.size()) >= s_maxLocalSlots)
+        {
+            throw std::runtime_error("Too many let bindings (max " + std::to_string(s_maxLocalSlots) + ")");
+        }
+
+        // Bindings may reference earlier bindings only
+        auto tokens = tokenizeExpression(expr, localContext);
+        bindings.push_back(infixToRPN(tokens));
+        localContext.registerLocal(name, static_cast<int>(bindings.size()) - 1);
+    }
+
     // Smart comma splitting that respects parentheses
     std::vector<std::string> expressions;
     std::string current;
-    int depth = 0;
+    depth = 0;
     
-    for (char c : equation_string) {
+    for (char c : componentString) {
         if (c == '(') {
             depth++;
             current += c;
@@ -654,52 +765,121 @@ ParsedEquation ParseEquation(const std::string &equation_string, const ParserCon
     // Parse AX expression (required)
     if (expressions.size() > 0 && !expressions[0].empty())
     {
-        auto tokens = tokenizeExpression(expressions[0], context);
+        auto tokens = tokenizeExpression(expressions[0], localContext);
         result.tokens_ax = infixToRPN(tokens);
     }
 
     // Parse AY expression (required)
     if (expressions.size() > 1 && !expressions[1].empty())
     {
-        auto tokens = tokenizeExpression(expressions[1], context);
+        auto tokens = tokenizeExpression(expressions[1], localContext);
         result.tokens_ay = infixToRPN(tokens);
     }
 
     // Parse Angular Acceleration (optional)
     if (expressions.size() > 2 && !expressions[2].empty())
     {
-        auto tokens = tokenizeExpression(expressions[2], context);
+        auto tokens = tokenizeExpression(expressions[2], localContext);
         result.tokens_angular = infixToRPN(tokens);
     }
 
     // Parse Color R (optional)
     if (expressions.size() > 3 && !expressions[3].empty())
     {
-        auto tokens = tokenizeExpression(expressions[3], context);
+        auto tokens = tokenizeExpression(expressions[3], localContext);
         result.tokens_r = infixToRPN(tokens);
     }
 
     // Parse Color G (optional)
     if (expressions.size() > 4 && !expressions[4].empty())
     {
-        auto tokens = tokenizeExpression(expressions[4], context);
+        auto tokens = tokenizeExpression(expressions[4], localContext);
         result.tokens_g = infixToRPN(tokens);
     }
 
     // Parse Color B (optional)
     if (expressions.size() > 5 && !expressions[5].empty())
     {
-        auto tokens = tokenizeExpression(expressions[5], context);
+        auto tokens = tokenizeExpression(expressions[5], localContext);
         result.tokens_b = infixToRPN(tokens);
     }
 
     // Parse Color A (optional)
     if (expressions.size() > 6 && !expressions[6].empty())
     {
-        auto tokens = tokenizeExpression(expressions[6], context);
+        auto tokens = tokenizeExpression(expressions[6], localContext);
         result.tokens_a = infixToRPN(tokens);
     }
 
+    // Emit each binding once, ahead of the first component (in shader evaluation
+    // order) that uses it; later components load the stored slot
+    if (!bindings.empty())
+    {
+        std::vector<bool> stored(bindings.size(), false);
+        std::vector<Token> *components[] = {
+            &result.tokens_ax, &result.tokens_ay, &result.tokens_angular,
+            &result.tokens_r, &result.tokens_g, &result.tokens_b, &result.tokens_a
+        };
+
+        for (auto *tokens : components)
+        {
+            if (tokens->empty())
+                continue;
+
+            std::vector<bool> needed(bindings.size(), false);
+            auto markUses = [&needed](const std::vector<Token> &toks) {
+                for (const auto &token : toks) {
+                    if (token.type == TOKEN_LOCAL_LOAD) needed[token.local_slot] = true;
+                }
+            };
+
+            // Bindings only reference earlier slots, so walking backwards closes over dependencies
+            markUses(*tokens);
+            for (int slot = static_cast<int>(bindings.size()) - 1; slot >= 0; --slot)
+            {
+                if (needed[slot]) markUses(bindings[slot]);
+            }
+
+            std::vector<Token> prelude;
+            for (size_t slot = 0; slot < bindings.size(); ++slot)
+            {
+                if (!needed[slot] || stored[slot])
+                    continue;
+
+                prelude.insert(prelude.end(), bindings[slot].begin(), bindings[slot].end());
+                Token storeToken(TOKEN_LOCAL_STORE);
+                storeToken.local_slot = static_cast<int>(slot);
+                prelude.push_back(storeToken);
+                stored[slot] = true;
+            }
+            tokens->insert(tokens->begin(), prelude.begin(), prelude.end());
+        }
+    }
+
+    // The shader skips any component longer than MAX_COMPONENT_TOKENS words, which
+    // would also skip the binding stores other components rely on; fail loudly instead
+    {
+        const std::pair<const char *, const std::vector<Token> *> components[] = {
+            {"ax", &result.tokens_ax}, {"ay", &result.tokens_ay}, {"angular", &result.tokens_angular},
+            {"r", &result.tokens_r}, {"g", &result.tokens_g}, {"b", &result.tokens_b}, {"a", &result.tokens_a}
+        };
+
+        for (const auto &component : components)
+        {
+            std::vector<int> words;
+            std::vector<float> constants;
+            std::unordered_map<float, int> constantMap;
+            serializeTokensToGPU(*component.second, words, constants, constantMap);
+
+            if (static_cast<int>(words.size()) > s_maxComponentTokens)
+            {
+                throw std::runtime_error("Equation component '" + std::string(component.first) + "' is too long: " +
+                                         std::to_string(words.size()) + " GPU tokens (max " +
+                                         std::to_string(s_maxComponentTokens) + ")");
+            }
+        }
+    }
+
     // Extract constants from all components
     auto extractConstants = [&result](const std::vector<Token>& tokens) {
         for (const auto &token : tokens) {
@@ -224,10 +224,7 @@ static bool LoadProject(const std::string& filepath)
 
         // Clear current simulation
         Objects::ResetToInitialConditions();
-        while (Objects::GetNumObjects() > 0)
-        {
-            Objects::RemoveObject(0);
-        }
+        Objects::RemoveAllObjects();
 
         // Clear UI state
         selectedObjectIndex = -1;
@@ -494,10 +491,7 @@ void UIManager::RenderMainUI()
             {
                 // Reset simulation to empty state
                 Objects::ResetToInitialConditions();
-                while (Objects::GetNumObjects() > 0)
-                {
-                    Objects::RemoveObject(0);
-                }
+                Objects::RemoveAllObjects();
                 g_physics.globalTime = 0.0f;
                 g_camera.Reset();
 
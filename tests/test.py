@@ -49,23 +49,16 @@ class SpeedTestConfig:
 
 def clear_all_objects(sim):
     """Clear all objects from simulation (handle default object)"""
-    # IMPORTANT: Always remove all objects starting from index 0
-    # The while loop ensures we remove everything including the default
-    while sim.object_count() > 0:
-        try:
-            sim.remove_object(0)
-        except:
-            break  # Break if we can't remove any more
+    # Removes everything including the default object in one call
+    sim.clear()
 
 def wait_for_shaders(sim):
     """Wait for shaders to load with progress display"""
     print("    Loading shaders...", end="", flush=True)
     start = time.time()
     
-    while not sim.are_all_shaders_ready():
-        progress = sim.get_shader_load_progress()
-        sim.update_shader_loading()
-        time.sleep(0.001)  # Very short sleep to not slow down
+    if not sim.wait_shaders_ready():
+        raise RuntimeError(f"Shaders failed to load: {sim.get_shader_load_status()}")
     
     load_time = time.time() - start
     print(f" {load_time:.2f}s")
@@ -775,8 +768,8 @@ def quick_performance_check():
     try:
         # Wait for shaders
         print("Loading shaders...", end="", flush=True)
-        while not sim.are_all_shaders_ready():
-            sim.update_shader_loading()
+        if not sim.wait_shaders_ready():
+            raise RuntimeError(f"Shaders failed to load: {sim.get_shader_load_status()}")
         print(" ✅")
         
         # Clear default object